@@ -1,6 +1,186 @@
 import math
+import numpy as np
 from typing import List, Tuple
 
+from algorithm_numba import (
+    NUMBA_AVAILABLE,
+    classify_quadrants,
+    quadrants_within_bounds,
+    sweep_best_event,
+    sweep_quadrant_counts
+)
+
+# Names of the quadrants, in the order count_points_in_quadrants returns their counts
+QUADRANT_LABELS = ("Q1", "Q2", "Q3", "Q4")
+
+# Position of each quadrant in a counter indexed by above_line1 + 2 * above_line2
+_QUADRANT_INDEX = {"Q1": 3, "Q2": 2, "Q3": 0, "Q4": 1}
+
+# Point sets up to this size are counted in plain Python rather than with NumPy
+_SMALL_POINT_COUNT = 32
+
+# Angle constants, computed once
+_HALF_PI = math.pi / 2
+_TWO_PI = 2 * math.pi
+_THREE_HALF_PI = 3 * math.pi / 2
+
+# Angle of the main line where the efficient algorithm's quarter-turn sweep starts
+_SWEEP_START = -math.pi / 4
+
+
+def _to_soa(points) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split points into contiguous float64 arrays of x and y coordinates.
+    
+    Args:
+        points: List of (x, y) coordinates or an (n, 2) array
+        
+    Returns:
+        Tuple (xs, ys) of coordinate arrays
+    """
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    
+    return np.ascontiguousarray(pts[:, 0]), np.ascontiguousarray(pts[:, 1])
+
+
+def _median_center(xs: np.ndarray, ys: np.ndarray) -> Tuple[float, float]:
+    """
+    Median x and y coordinates of the points, used as the concurrency point.
+    
+    For an even number of points this is the upper median (the element at index n//2
+    after sorting), not the average of the two middle values that np.median returns.
+    
+    Args:
+        xs: x coordinates
+        ys: y coordinates
+        
+    Returns:
+        Tuple (median_x, median_y)
+    """
+    middle = len(xs) // 2
+    
+    # np.partition selects the middle element of each axis in O(n) without sorting
+    median_x = np.partition(xs, middle)[middle]
+    median_y = np.partition(ys, middle)[middle]
+    
+    return float(median_x), float(median_y)
+
+
+def _relative_points(xs: np.ndarray, ys: np.ndarray,
+                     center: Tuple[float, float]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Offsets of the points from the center, leaving out any point on the center itself.
+    
+    Args:
+        xs: x coordinates
+        ys: y coordinates
+        center: Concurrency point (x, y)
+        
+    Returns:
+        Tuple (dx, dy) of offset arrays
+    """
+    dx = xs - center[0]
+    dy = ys - center[1]
+    not_center = (dx != 0) | (dy != 0)
+    
+    return dx[not_center], dy[not_center]
+
+
+def _line_directions(slope: float) -> Tuple[float, float, float, float]:
+    """
+    Direction vectors of a line with the given slope and of its perpendicular.
+    
+    Both vectors point to the right (or straight up for a vertical line), so a point
+    is above a line exactly when its cross product with the direction is positive.
+    
+    Args:
+        slope: Slope of the line (inf for a vertical line)
+        
+    Returns:
+        Tuple (c, s, perp_c, perp_s) with the two direction vectors
+    """
+    if math.isinf(slope):
+        c, s = 0.0, 1.0
+    else:
+        c, s = 1.0, slope
+    
+    # Rotate by a quarter turn, choosing the sense that keeps the vector pointing right
+    perp_c, perp_s = (s, -c) if s > 0 else (-s, c)
+    
+    return c, s, perp_c, perp_s
+
+
+def _balanced_imbalance(num_points: int, n: int) -> float:
+    """
+    Smallest possible imbalance when num_points points are split into four quadrants.
+    
+    Args:
+        num_points: Number of points to split (the center point is not counted)
+        n: Total number of points (the target per quadrant is n/4)
+        
+    Returns:
+        Imbalance of the most even split, where each quadrant gets
+        num_points // 4 or num_points // 4 + 1 points
+    """
+    target = n / 4
+    low, remainder = divmod(num_points, 4)
+    imbalance = abs(low - target)
+    
+    if remainder:
+        imbalance = max(imbalance, abs(low + 1 - target))
+    
+    return imbalance
+
+
+def _wrap_angles(angles: np.ndarray) -> np.ndarray:
+    """
+    Map angles in (-2π, 2π) to [0, 2π).
+    
+    Equivalent to angles % 2π for this range, but a single conditional add is much
+    cheaper than NumPy's floating-point modulo.
+    
+    Args:
+        angles: Angles in radians, in (-2π, 2π)
+        
+    Returns:
+        The same angles in [0, 2π)
+    """
+    return np.where(angles < 0, angles + _TWO_PI, angles)
+
+
+def _quadrant_counts_by_angle(sorted_angles: np.ndarray, angles: np.ndarray) -> np.ndarray:
+    """
+    Count the points in each quadrant for every rotation angle of the two lines.
+    
+    A point with angle phi (around the concurrency point) lies in quadrant k when
+    (phi - angle) mod 2π falls in [kπ/2, (k+1)π/2). Each quadrant is therefore an
+    angular window, and its count is the number of sorted point angles inside it.
+    
+    Args:
+        sorted_angles: Point angles in [0, 2π), sorted ascending
+        angles: Rotation angles to evaluate
+        
+    Returns:
+        Array of shape (len(angles), 4) with the counts of Q1..Q4
+    """
+    # Unroll the circle once so that every window is a plain interval
+    unrolled = np.concatenate([sorted_angles, sorted_angles + _TWO_PI])
+    
+    starts = _wrap_angles(np.asarray(angles))
+    edge_offsets = np.array([0, _HALF_PI, math.pi, _THREE_HALF_PI, _TWO_PI])
+    
+    if not NUMBA_AVAILABLE:
+        edges = starts[:, None] + edge_offsets
+        return np.diff(np.searchsorted(unrolled, edges, side='left'), axis=1)
+    
+    # The compiled kernel finds all window edges in a single merge pass, which needs
+    # the rotation angles in ascending order
+    order = np.argsort(starts, kind='stable')
+    counts = np.empty((len(starts), 4), dtype=np.int64)
+    counts[order] = sweep_quadrant_counts(unrolled, starts[order], edge_offsets)
+    
+    return counts
+
 
 def orthogonal_equipartition(points: List[Tuple[float, float]]) -> Tuple[Tuple[float, float], float]:
     """
@@ -14,86 +194,46 @@ def orthogonal_equipartition(points: List[Tuple[float, float]]) -> Tuple[Tuple[f
         - (x, y) coordinates of the concurrency point P
         - slope of one line (the other is perpendicular with slope -1/m)
     """
-    n = len(points)
-    
-    # Review: Not the most readable. Use library function instead?
-    # Sort points by x and y coordinates
-    points_by_x = sorted(points, key=lambda p: p[0])
-    points_by_y = sorted(points, key=lambda p: p[1])
+    xs, ys = _to_soa(points)
+    n = len(xs)
     
-    # Review: ditto review as the sorting method before.
     # Step 1: Find median points and initial halving lines
-    median_x = points_by_x[n // 2][0]
-    median_y = points_by_y[n // 2][1]
+    median_x, median_y = _median_center(xs, ys)
     
     # Prepare to track points in each quadrant as we rotate
     # Consider slopes from -∞ to +∞ (which we'll represent by angles from π/2 to -π/2)
     # Start with vertical and horizontal lines (slope = inf and 0)
     
     # We need to track slopes where quadrant counts change
-    critical_angles = []
-    
-    # For each point, compute angle to the median point
     center_point = (median_x, median_y)
-    for pt in points:
-        if pt[0] == center_point[0] and pt[1] == center_point[1]:
-            continue  # Skip the center point itself
-            
-        # Calculate angle from center to point
-        dx = pt[0] - center_point[0]
-        dy = pt[1] - center_point[1]
-        angle = math.atan2(dy, dx)
-        
-        # Add both the angle and angle + π/2 (perpendicular)
-        critical_angles.append(angle)
-        critical_angles.append(angle + math.pi/2)
-        critical_angles.append(angle - math.pi/2)
     
-    # Sort angles and remove duplicates
-    critical_angles = sorted(list(set(critical_angles)))
+    # For each point, compute angle to the median point (skipping the center point itself)
+    dx, dy = _relative_points(xs, ys, center_point)
+    pt_angles = np.arctan2(dy, dx)
     
-    # Evaluate each critical angle
-    best_imbalance = n  # Start with worst possible imbalance
+    # A point crosses one of the lines whenever the rotation reaches its angle plus a
+    # multiple of π/2. The pair of lines repeats after a quarter turn (only the quadrant
+    # labels change), so reducing the angles mod π/2 gives every critical angle once
+    critical_angles = np.unique(np.mod(pt_angles, _HALF_PI))
+    
+    # Rotational sweep: sort the point angles once and read the quadrant counts for
+    # every orientation off with binary searches instead of recounting all points
     best_angle = 0
     
-    for angle in critical_angles:
-        # Calculate the slope from the angle
-        slope = math.tan(angle)
-        perp_slope = -1/slope if slope != 0 else float('inf')
-        
-        # Count points in each quadrant
-        q1, q2, q3, q4 = 0, 0, 0, 0
-        
-        for pt in points:
-            if pt[0] == center_point[0] and pt[1] == center_point[1]:
-                continue  # Skip the center point
-                
-            # Check which quadrant the point belongs to
-            # To avoid issues with infinite slope, use angle-based classification
-            dx = pt[0] - center_point[0]
-            dy = pt[1] - center_point[1]
-            pt_angle = math.atan2(dy, dx)
-            
-            # Determine quadrant based on angles
-            rel_angle = (pt_angle - angle) % (2 * math.pi)
-            
-            if 0 <= rel_angle < math.pi/2:
-                q1 += 1
-            elif math.pi/2 <= rel_angle < math.pi:
-                q2 += 1
-            elif math.pi <= rel_angle < 3*math.pi/2:
-                q3 += 1
-            else:
-                q4 += 1
+    if len(critical_angles) > 0:
+        # The counts only change at critical angles, so evaluate the midpoint between
+        # each pair of neighbouring ones (including the gap that wraps around to the
+        # next quarter turn), where no point lies on either line
+        next_angles = np.append(critical_angles[1:], critical_angles[0] + _HALF_PI)
+        sweep_angles = (critical_angles + next_angles) / 2
+        counts = _quadrant_counts_by_angle(np.sort(_wrap_angles(pt_angles)), sweep_angles)
         
         # Calculate imbalance (how far from perfect n/4 in each quadrant)
         target = n / 4
-        imbalance = max(abs(q1 - target), abs(q2 - target), 
-                        abs(q3 - target), abs(q4 - target))
+        imbalance = np.abs(counts - target).max(axis=1)
         
-        if imbalance < best_imbalance:
-            best_imbalance = imbalance
-            best_angle = angle
+        # argmin keeps the first (smallest) angle among equally good ones
+        best_angle = sweep_angles[np.argmin(imbalance)]
     
     # Convert best angle to slope
     best_slope = math.tan(best_angle)
@@ -106,8 +246,9 @@ def orthogonal_equipartition_efficient(points: List[Tuple[float, float]]) -> Tup
     Based on the Roy and Steiger (2007) paper "Some Combinatorial and Algorithmic Applications
     of the Borsuk-Ulam Theorem".
     
-    This implementation uses a more efficient slope-based approach for evaluating orientations,
-    which is more numerically stable and has better performance for larger point sets.
+    This implementation sweeps the orientation of the lines through a quarter turn,
+    updating the quadrant counts incrementally as each point crosses a line, so all
+    orientations are evaluated in O(n log n) time.
     
     Args:
         points: List of (x, y) coordinates
@@ -117,178 +258,164 @@ def orthogonal_equipartition_efficient(points: List[Tuple[float, float]]) -> Tup
         - (x, y) coordinates of the concurrency point P
         - slope of one line (the other is perpendicular with slope -1/m)
     """
-    n = len(points)
-    
-    # Sort points by x and y coordinates
-    points_by_x = sorted(points, key=lambda p: p[0])
-    points_by_y = sorted(points, key=lambda p: p[1])
+    xs, ys = _to_soa(points)
+    n = len(xs)
     
     # Find median points to use as initial concurrency point
-    median_x = points_by_x[n // 2][0]
-    median_y = points_by_y[n // 2][1]
+    median_x, median_y = _median_center(xs, ys)
     center_point = (median_x, median_y)
     
-    # Transform all points to be relative to the center point
-    relative_points = []
-    for pt in points:
-        if pt[0] == center_point[0] and pt[1] == center_point[1]:
-            continue  # Skip the center point
-        
-        # Use relative coordinates
-        dx = pt[0] - center_point[0]
-        dy = pt[1] - center_point[1]
-        relative_points.append((dx, dy))
-    
-    # Compute all slopes where a point moves from one quadrant to another
-    # This happens when the line passes through a point
-    slope_events = []
-    for dx, dy in relative_points:
-        # Compute the slope of the line from the center to the point
-        if dx == 0:
-            slope = float('inf')
-        else:
-            slope = dy / dx
-        
-        # When a line passes through a point, both the line and its perpendicular
-        # line cause quadrant count changes
-        slope_events.append((slope, 1))  # Main line
-        
-        # Perpendicular slope
-        if slope == 0:
-            perp_slope = float('inf')
-        elif math.isfinite(slope):
-            perp_slope = -1 / slope
-        else:
-            perp_slope = 0
-            
-        slope_events.append((perp_slope, 2))  # Perpendicular line
-    
-    # Sort all events by slope
-    slope_events.sort()
-    
-    # Create initial configuration (vertical and horizontal lines)
-    # Start with a vertical line (slope = inf) and horizontal line (slope = 0)
-    # Count initial quadrants
-    q1, q2, q3, q4 = 0, 0, 0, 0
-    
-    for dx, dy in relative_points:
-        if dx > 0 and dy > 0:
-            q1 += 1
-        elif dx < 0 and dy > 0:
-            q2 += 1
-        elif dx < 0 and dy < 0:
-            q3 += 1
-        else:  # dx > 0 and dy < 0
-            q4 += 1
-    
-    # Keep track of the best configuration
+    # Transform all points to be relative to the center point, skipping the center point
+    dx, dy = _relative_points(xs, ys, center_point)
+    
+    # The pair of lines repeats after a quarter turn (only the quadrant labels change),
+    # so sweep the main line's angle over [-π/4, π/4) and track the quadrant counts
     target = n / 4
-    best_imbalance = max(abs(q1 - target), abs(q2 - target), 
-                     abs(q3 - target), abs(q4 - target))
     best_slope = 0  # Horizontal line
     
-    # Quadrant adjacency: when we rotate clockwise, points move between adjacent quadrants
-    # Process all slope events and track quadrant counts
-    current_slope = float('-inf')
+    if len(dx) == 0:
+        return center_point, best_slope
     
-    for slope, event_type in slope_events:
-        if slope == current_slope:
-            continue
-            
-        current_slope = slope
-        
-        # Update quadrant counts based on the current configuration
-        if event_type == 1:  # Main line rotates
-            # As the line rotates, points move between quadrants in a specific pattern
-            # For a clockwise rotation, the transitions are:
-            # When the line is at slope s, points near the line move:
-            # Q1 -> Q4, Q2 -> Q1, Q3 -> Q2, Q4 -> Q3
-            
-            # Update quadrant counts (this is a simplified model)
-            # In a real implementation, we would need to track exactly which points move
-            # For demonstration, we're using a simplified approach that considers
-            # the effects of rotating lines
-            
-            # Calculate new quadrant counts based on the current slope
-            new_q1, new_q2, new_q3, new_q4 = 0, 0, 0, 0
-            
-            for dx, dy in relative_points:
-                # Check if point is above the main line
-                above_main = dy > slope * dx if slope != float('inf') else dx < 0
-                
-                # Check if point is above the perpendicular line
-                perp_slope = -1/slope if slope != 0 and slope != float('inf') else float('inf') if slope == 0 else 0
-                above_perp = dy > perp_slope * dx if perp_slope != float('inf') else dx < 0
-                
-                if above_main and above_perp:
-                    new_q1 += 1
-                elif not above_main and above_perp:
-                    new_q2 += 1
-                elif not above_main and not above_perp:
-                    new_q3 += 1
-                else:  # above_main and not above_perp
-                    new_q4 += 1
-            
-            # Update quadrant counts
-            q1, q2, q3, q4 = new_q1, new_q2, new_q3, new_q4
-            
-            # Check if this is a better configuration
-            imbalance = max(abs(q1 - target), abs(q2 - target), 
-                           abs(q3 - target), abs(q4 - target))
-            
-            if imbalance < best_imbalance:
-                best_imbalance = imbalance
-                best_slope = slope
+    # Quadrant of every point at the start of the sweep (0..3 counter-clockwise from
+    # the main line), and how far the lines rotate before the point crosses into the
+    # previous quadrant; each point crosses exactly one boundary per quarter turn
+    rel_angles = _wrap_angles(np.arctan2(dy, dx) - _SWEEP_START)
+    quadrants = np.minimum((rel_angles // _HALF_PI).astype(np.intp), 3)
+    crossings = rel_angles - quadrants * _HALF_PI
+    
+    # Sort the crossing events once; the counts are then updated one event at a time
+    order = np.argsort(crossings, kind='stable')
+    crossings = crossings[order]
+    group_ends = np.append(crossings[1:] != crossings[:-1], True)
+    
+    # No orientation can do better than splitting the points as evenly as possible
+    optimal_imbalance = _balanced_imbalance(len(dx), n)
+    
+    best_event = sweep_best_event(quadrants[order], group_ends,
+                                  np.bincount(quadrants, minlength=4),
+                                  target, optimal_imbalance)
+    
+    # The counts are constant until the next crossing (wrapping around to the first
+    # crossing of the next quarter turn), so use the middle of that rotation range
+    if best_event + 1 < len(crossings):
+        next_crossing = crossings[best_event + 1]
+    else:
+        next_crossing = crossings[0] + _HALF_PI
+    rotation = ((crossings[best_event] + next_crossing) / 2) % _HALF_PI
+    best_slope = math.tan(_SWEEP_START + rotation)
     
     return center_point, best_slope
 
-def count_points_in_quadrants(points, center, slope):
+def count_points_in_quadrants(points, center, slope) -> Tuple[int, int, int, int]:
     """
     Count how many points fall in each quadrant.
     
     Args:
-        points: List of (x, y) coordinates
+        points: List of (x, y) coordinates or an (n, 2) array
         center: Concurrency point (x, y)
         slope: Slope of the first line
         
     Returns:
-        Dictionary with quadrant counts
+        Tuple with the counts of Q1, Q2, Q3 and Q4 (see QUADRANT_LABELS)
+    """
+    if len(points) <= _SMALL_POINT_COUNT:
+        return _count_points_small(points, center, slope)
+    
+    xs, ys = _to_soa(points)
+    
+    return _count_points_arrays(xs, ys, float(center[0]), float(center[1]), float(slope))
+
+def count_points_in_quadrants_soa(xs: np.ndarray, ys: np.ndarray, center,
+                                  slope) -> Tuple[int, int, int, int]:
     """
-    perp_slope = -1/slope if slope != 0 else float('inf')
+    Count how many points fall in each quadrant, for points already split by axis.
     
-    q1, q2, q3, q4 = 0, 0, 0, 0
+    Variant of count_points_in_quadrants for callers that keep the coordinates as
+    separate contiguous arrays, in float32 or float64. The arrays are used as they
+    are, without conversion.
     
-    for pt in points:
-        if pt[0] == center[0] and pt[1] == center[1]:
+    Args:
+        xs: x coordinates
+        ys: y coordinates
+        center: Concurrency point (x, y)
+        slope: Slope of the first line
+        
+    Returns:
+        Tuple with the counts of Q1, Q2, Q3 and Q4 (see QUADRANT_LABELS)
+    """
+    return _count_points_arrays(xs, ys, float(center[0]), float(center[1]), float(slope))
+
+def _count_points_small(points, center, slope) -> Tuple[int, int, int, int]:
+    """
+    Quadrant counting for count_points_in_quadrants on a handful of points.
+    
+    Same classification as _count_points_arrays, but in plain Python: for small point
+    sets, converting to arrays and dispatching NumPy calls costs more than the loop.
+    
+    Args:
+        points: List of (x, y) coordinates or an (n, 2) array
+        center: Concurrency point (x, y)
+        slope: Slope of the first line
+        
+    Returns:
+        Tuple with the counts of Q1, Q2, Q3 and Q4
+    """
+    c, s, perp_c, perp_s = _line_directions(slope)
+    center_x, center_y = float(center[0]), float(center[1])
+    
+    counts = [0, 0, 0, 0]
+    
+    for x, y in points:
+        dx = float(x) - center_x
+        dy = float(y) - center_y
+        
+        if dx == 0 and dy == 0:
             continue  # Skip the center point
-            
-        # Check which quadrant the point belongs to
-        dx = pt[0] - center[0]
-        dy = pt[1] - center[1]
         
-        # Line 1: y - center[1] = slope * (x - center[0])
-        above_line1 = dy > slope * dx
+        counts[(c * dy - s * dx > 0) + 2 * (perp_c * dy - perp_s * dx > 0)] += 1
+    
+    return tuple(counts[_QUADRANT_INDEX[quadrant]] for quadrant in QUADRANT_LABELS)
+
+def _count_points_arrays(xs: np.ndarray, ys: np.ndarray, center_x: float, center_y: float,
+                         slope: float) -> Tuple[int, int, int, int]:
+    """
+    Quadrant counting on coordinate arrays, shared by count_points_in_quadrants and
+    count_points_in_quadrants_soa.
+    
+    Args:
+        xs: x coordinates
+        ys: y coordinates
+        center_x, center_y: Concurrency point
+        slope: Slope of the first line
         
-        # Line 2: y - center[1] = perp_slope * (x - center[0])
-        above_line2 = dy > perp_slope * dx
+    Returns:
+        Tuple with the counts of Q1, Q2, Q3 and Q4
+    """
+    c, s, perp_c, perp_s = _line_directions(slope)
+    
+    if NUMBA_AVAILABLE:
+        # The compiled kernel classifies and counts in one pass without temporaries
+        counts = classify_quadrants(xs, ys, center_x, center_y, c, s, perp_c, perp_s)
+    else:
+        # Skip the center point
+        dx, dy = _relative_points(xs, ys, (center_x, center_y))
         
-        if above_line1 and above_line2:
-            q1 += 1
-        elif not above_line1 and above_line2:
-            q2 += 1
-        elif not above_line1 and not above_line2:
-            q3 += 1
-        else:  # above_line1 and not above_line2
-            q4 += 1
-    
-    return {"Q1": q1, "Q2": q2, "Q3": q3, "Q4": q4}
+        # A point is above a line when it lies to the left of the line's direction vector
+        # (positive cross product), which needs no special case for vertical lines.
+        # Pack "above line 1" and "above line 2" into one index instead of branching
+        above_line1 = c * dy - s * dx > 0
+        above_line2 = perp_c * dy - perp_s * dx > 0
+        index = above_line1.astype(np.intp) + 2 * above_line2
+        counts = np.bincount(index, minlength=4)
+    
+    return tuple(int(counts[_QUADRANT_INDEX[quadrant]]) for quadrant in QUADRANT_LABELS)
 
 def is_equipartition_valid(quadrant_counts, n):
     """
     Check if the quadrant counts satisfy the equipartition requirement.
     
     Args:
-        quadrant_counts: Dictionary with quadrant counts
+        quadrant_counts: Tuple with the counts of Q1, Q2, Q3 and Q4
         n: Total number of points
         
     Returns:
@@ -297,4 +424,32 @@ def is_equipartition_valid(quadrant_counts, n):
     expected_min = math.floor(n / 4)
     expected_max = math.ceil(n / 4)
     
-    return all(expected_min <= count <= expected_max for count in quadrant_counts.values())
+    return all(expected_min <= count <= expected_max for count in quadrant_counts)
+
+def is_equipartition_valid_soa(xs: np.ndarray, ys: np.ndarray, center, slope, n) -> bool:
+    """
+    Check if two lines equipartition the points, without returning the counts.
+    
+    Equivalent to is_equipartition_valid(count_points_in_quadrants_soa(...), n) for
+    callers that only need the verdict. With Numba available the scan stops early as
+    soon as one quadrant holds too many points.
+    
+    Args:
+        xs: x coordinates
+        ys: y coordinates
+        center: Concurrency point (x, y)
+        slope: Slope of the first line
+        n: Total number of points
+        
+    Returns:
+        Boolean indicating if equipartition is valid
+    """
+    if not NUMBA_AVAILABLE:
+        return is_equipartition_valid(count_points_in_quadrants_soa(xs, ys, center, slope), n)
+    
+    c, s, perp_c, perp_s = _line_directions(float(slope))
+    
+    return bool(quadrants_within_bounds(xs, ys, float(center[0]), float(center[1]),
+                                        c, s, perp_c, perp_s,
+                                        math.floor(n / 4), math.ceil(n / 4)))
+
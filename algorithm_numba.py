@@ -0,0 +1,207 @@
+"""
+Compiled kernels for the tight numeric loops of the equipartition algorithms.
+
+Numba is optional: when it is not installed the kernels below run as plain
+Python functions, so results are identical either way (only slower).
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange, set_num_threads
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def set_num_threads(n):
+        """Stand-in for numba.set_num_threads; plain Python kernels are single-threaded."""
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Number of rotation angles swept by one parallel task in sweep_quadrant_counts
+SWEEP_CHUNK_SIZE = 1024
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def sweep_quadrant_counts(unrolled_angles: np.ndarray, starts: np.ndarray,
+                          edge_offsets: np.ndarray) -> np.ndarray:
+    """
+    Count the points in each quadrant for an ascending sequence of rotation angles.
+
+    Quadrant k of rotation i is the window [starts[i] + edge_offsets[k],
+    starts[i] + edge_offsets[k + 1]). As the rotations are sorted, every window edge
+    only moves forward, so one merge-like pass over the sorted point angles finds
+    the counts for a run of rotations. The rotations are split into chunks that are
+    swept in parallel, each starting from a binary search. The GIL is released while
+    the kernel runs.
+
+    Args:
+        unrolled_angles: Sorted point angles in [0, 2π) followed by the same angles + 2π
+        starts: Rotation angles in [0, 2π), sorted ascending
+        edge_offsets: The five window edges relative to a rotation (0, π/2, π, 3π/2, 2π)
+
+    Returns:
+        Array of shape (len(starts), 4) with the counts of quadrants 0..3
+    """
+    num_angles = unrolled_angles.shape[0]
+    num_rotations = starts.shape[0]
+    counts = np.empty((num_rotations, 4), dtype=np.int64)
+    num_chunks = (num_rotations + SWEEP_CHUNK_SIZE - 1) // SWEEP_CHUNK_SIZE
+
+    for chunk in prange(num_chunks):
+        first = chunk * SWEEP_CHUNK_SIZE
+        last = min(first + SWEEP_CHUNK_SIZE, num_rotations)
+
+        # Number of point angles below each window edge
+        positions = np.empty(5, dtype=np.int64)
+        for k in range(5):
+            positions[k] = np.searchsorted(unrolled_angles, starts[first] + edge_offsets[k])
+
+        for i in range(first, last):
+            for k in range(5):
+                edge = starts[i] + edge_offsets[k]
+                position = positions[k]
+                while position < num_angles and unrolled_angles[position] < edge:
+                    position += 1
+                positions[k] = position
+
+            for k in range(4):
+                counts[i, k] = positions[k + 1] - positions[k]
+
+    return counts
+
+
+@njit(cache=True)
+def sweep_best_event(from_quadrants: np.ndarray, group_ends: np.ndarray,
+                     initial_counts: np.ndarray, target: float,
+                     optimal_imbalance: float) -> int:
+    """
+    Rotate the lines through a sorted sequence of crossing events and find the best one.
+
+    At each event a point leaves its quadrant for the previous one, so the counts are
+    updated in O(1) instead of being recounted. Several events may happen at the same
+    rotation; only the counts after the last of them are evaluated.
+
+    Args:
+        from_quadrants: Quadrant (0..3) each point leaves, in event order
+        group_ends: Whether each event is the last one at its rotation
+        initial_counts: Counts of quadrants 0..3 before the first event
+        target: Ideal number of points per quadrant
+        optimal_imbalance: Imbalance at which the sweep can stop early
+
+    Returns:
+        Index of the event after which the imbalance is smallest (the first one on ties)
+    """
+    counts = initial_counts.copy()
+    best_event = -1
+    best_imbalance = np.inf
+
+    for i in range(from_quadrants.shape[0]):
+        quadrant = from_quadrants[i]
+        counts[quadrant] -= 1
+        counts[(quadrant + 3) % 4] += 1
+
+        if not group_ends[i]:
+            continue
+
+        imbalance = 0.0
+        for k in range(4):
+            imbalance = max(imbalance, abs(counts[k] - target))
+
+        if imbalance < best_imbalance:
+            best_imbalance = imbalance
+            best_event = i
+
+            # Stop as soon as a perfect equipartition has been found
+            if best_imbalance <= optimal_imbalance:
+                break
+
+    return best_event
+
+
+@njit(cache=True)
+def classify_quadrants(xs: np.ndarray, ys: np.ndarray, center_x: float, center_y: float,
+                       c: float, s: float, perp_c: float, perp_s: float) -> np.ndarray:
+    """
+    Count the points on each side of two lines through a center, in one pass.
+
+    A point is above a line when its cross product with the line's direction vector
+    is positive. Points on the center itself are skipped.
+
+    Args:
+        xs: x coordinates
+        ys: y coordinates
+        center_x, center_y: Point where the two lines cross
+        c, s: Direction vector of the first line
+        perp_c, perp_s: Direction vector of the second line
+
+    Returns:
+        Array of 4 counts indexed by above_line1 + 2 * above_line2
+    """
+    counts = np.zeros(4, dtype=np.int64)
+
+    for i in range(xs.shape[0]):
+        dx = xs[i] - center_x
+        dy = ys[i] - center_y
+        if dx == 0 and dy == 0:
+            continue
+
+        index = 0
+        if c * dy - s * dx > 0:
+            index += 1
+        if perp_c * dy - perp_s * dx > 0:
+            index += 2
+        counts[index] += 1
+
+    return counts
+
+
+@njit(cache=True)
+def quadrants_within_bounds(xs: np.ndarray, ys: np.ndarray, center_x: float, center_y: float,
+                            c: float, s: float, perp_c: float, perp_s: float,
+                            min_count: int, max_count: int) -> bool:
+    """
+    Check whether every quadrant holds between min_count and max_count points.
+
+    Same classification as classify_quadrants, but the scan stops as soon as one
+    quadrant exceeds max_count, as the answer is then known to be False.
+
+    Args:
+        xs: x coordinates
+        ys: y coordinates
+        center_x, center_y: Point where the two lines cross
+        c, s: Direction vector of the first line
+        perp_c, perp_s: Direction vector of the second line
+        min_count: Smallest allowed number of points per quadrant
+        max_count: Largest allowed number of points per quadrant
+
+    Returns:
+        Whether all four counts lie within the bounds
+    """
+    counts = np.zeros(4, dtype=np.int64)
+
+    for i in range(xs.shape[0]):
+        dx = xs[i] - center_x
+        dy = ys[i] - center_y
+        if dx == 0 and dy == 0:
+            continue
+
+        index = 0
+        if c * dy - s * dx > 0:
+            index += 1
+        if perp_c * dy - perp_s * dx > 0:
+            index += 2
+        counts[index] += 1
+
+        if counts[index] > max_count:
+            return False
+
+    for k in range(4):
+        if counts[k] < min_count:
+            return False
+
+    return True
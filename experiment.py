@@ -1,20 +1,172 @@
 import time
 import math
 import os
+import sys
 import json
 import datetime
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple, Callable, Optional, Any
 from collections import defaultdict
 
+from algorithm_numba import set_num_threads
 from algorithm import (
     orthogonal_equipartition, 
     orthogonal_equipartition_efficient, 
     count_points_in_quadrants, 
-    is_equipartition_valid
+    count_points_in_quadrants_soa,
+    is_equipartition_valid,
+    is_equipartition_valid_soa,
+    QUADRANT_LABELS
 )
 from point_generators import get_generator
 from visualization import plot_result, plot_multiple_distributions
 
+# Directories already created by this process
+_ensured_dirs = set()
+
+# Number of per-trial output lines collected before they are written in one go
+_OUTPUT_BATCH_SIZE = 64
+
+# Padded "Valid" column of the per-trial output
+_VALID_LABELS = {True: f"{'True':<8}", False: f"{'False':<8}"}
+
+
+def _ensure_dir(path: str):
+    """
+    Create a directory (and its parents) unless this process already did.
+    
+    Args:
+        path: Directory to create
+    """
+    if path not in _ensured_dirs:
+        os.makedirs(path, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+def _flush_lines(lines: List[str]):
+    """
+    Write buffered output lines to stdout in a single call and empty the buffer.
+    
+    Args:
+        lines: Output lines without trailing newlines
+    """
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+        lines.clear()
+
+
+def _warm_up(algorithms: List[Callable], num_points: int = 64):
+    """
+    Run the algorithms and the quadrant counting once on a throwaway point set.
+    
+    The first call of a compiled kernel includes its JIT compilation (or loading it
+    from the on-disk cache), which would otherwise be timed as part of the first trial.
+    
+    Args:
+        algorithms: Algorithm functions to warm up
+        num_points: Size of the throwaway point set
+    """
+    points = np.random.default_rng(0).random((num_points, 2))
+    
+    for algorithm in algorithms:
+        center, slope = algorithm(points)
+        count_points_in_quadrants(points, center, slope)
+
+
+def _init_worker(algorithms: List[Callable]):
+    """
+    Prepare a worker process: limit the compiled kernels to one thread and warm them up.
+    
+    The workers already use every CPU between them, so parallel kernels inside them
+    would oversubscribe the CPUs and skew the timed regions.
+    
+    Args:
+        algorithms: Algorithm functions to warm up
+    """
+    set_num_threads(1)
+    _warm_up(algorithms)
+
+
+def _map_trials(function: Callable, tasks: List[tuple], algorithms: List[Callable],
+                max_workers: Optional[int] = None):
+    """
+    Apply a trial function to every task, in worker processes when asked for.
+    
+    Results are yielded in task order as they become available. Starting a worker
+    (importing the libraries and warming up the algorithms) takes far longer than a
+    typical trial, so the trials run in this process unless max_workers asks for a
+    pool, and only when there are enough tasks to give every worker several.
+    
+    Args:
+        function: Module-level trial function taking one task
+        tasks: Picklable task tuples
+        algorithms: Algorithm functions the trials run, warmed up before timing
+        max_workers: Number of worker processes (default: run in this process)
+        
+    Yields:
+        The result of each task
+    """
+    workers = max_workers or 1
+    
+    if workers < 2 or len(tasks) < 2 * workers:
+        _warm_up(algorithms)
+        yield from map(function, tasks)
+        return
+    
+    # Workers are spawned rather than forked: forking after the compiled kernels have
+    # started their thread pool is not safe
+    chunksize = max(1, len(tasks) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                             initializer=_init_worker, initargs=(algorithms,)) as executor:
+        yield from executor.map(function, tasks, chunksize=chunksize)
+
+
+def _generate_axes(generator, n: int, seed: int, dtype: type):
+    """
+    Generate a trial's points directly in the requested precision and split them per axis.
+    
+    Args:
+        generator: PointGenerator to draw from
+        n: Number of points
+        seed: Random seed of the trial
+        dtype: Float type of the coordinates
+        
+    Returns:
+        Tuple (points, xs, ys) of contiguous arrays, with points of shape (n, 2)
+    """
+    points = np.ascontiguousarray(generator.generate(n, seed=seed, dtype=dtype))
+    xs = np.ascontiguousarray(points[:, 0])
+    ys = np.ascontiguousarray(points[:, 1])
+    
+    return points, xs, ys
+
+
+def _run_trial(task: tuple):
+    """
+    Run one trial of run_experiment: generate the points, time the algorithm and count.
+    
+    Args:
+        task: Tuple (generator, n, seed, algorithm, point_dtype, keep_points)
+        
+    Returns:
+        Tuple (points, center, slope, counts, execution_time), where points is None
+        unless keep_points is set
+    """
+    generator, n, seed, algorithm, point_dtype, keep_points = task
+    points, xs, ys = _generate_axes(generator, n, seed, point_dtype)
+    
+    # Measure execution time
+    start_time = time.perf_counter_ns()
+    center, slope = algorithm(points)
+    execution_time = (time.perf_counter_ns() - start_time) * 1e-9
+    
+    # Count points in quadrants
+    counts = count_points_in_quadrants_soa(xs, ys, center, slope)
+    
+    return (points if keep_points else None), center, slope, counts, execution_time
+
 
 def run_experiment(generator_names: List[str], 
                  num_points: int = 200, 
@@ -24,7 +176,9 @@ def run_experiment(generator_names: List[str],
                  verbose: bool = True,
                  plots_dir: str = "plots",
                  results_dir: str = "results",
-                 use_efficient: bool = False):
+                 use_efficient: bool = False,
+                 max_workers: Optional[int] = None,
+                 point_dtype: type = np.float64):
     """
     Run a comprehensive experiment testing the orthogonal equipartition algorithm.
     
@@ -38,6 +192,8 @@ def run_experiment(generator_names: List[str],
         plots_dir: Directory to save plots
         results_dir: Directory to save results
         use_efficient: Whether to use the efficient algorithm implementation
+        max_workers: Number of worker processes for the trials (default: run them in this process)
+        point_dtype: Float type the point coordinates are stored in (np.float64 or np.float32)
         
     Returns:
         Tuple of (all_results, summary)
@@ -49,11 +205,11 @@ def run_experiment(generator_names: List[str],
     algorithm_name = "efficient" if use_efficient else "original"
     
     # Ensure directories exist
-    os.makedirs(plots_dir, exist_ok=True)
-    os.makedirs(results_dir, exist_ok=True)
+    _ensure_dir(plots_dir)
+    _ensure_dir(results_dir)
     
-    # Results tracking
-    all_results = []
+    # Results tracking, one slot per trial
+    all_results = [None] * (len(generator_names) * num_trials)
     
     # Create timestamp for this experiment run
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -70,33 +226,43 @@ def run_experiment(generator_names: List[str],
     # Track points for visualization comparison
     distribution_points = {}
     
-    # Run tests for each distribution
+    # One task per trial, with a unique seed for each trial of a distribution
+    trials = []
+    tasks = []
     for dist_name in generator_names:
         generator = get_generator(dist_name)
         
         for trial in range(num_trials):
-            # Generate points with unique seed for each trial
+            trials.append((dist_name, trial))
+            tasks.append((generator, n, base_seed + trial, algorithm, point_dtype, trial == 0))
+    
+    # Stream the detailed results to a JSON Lines file as the trials complete
+    detailed_results_file = os.path.join(results_dir, f"detailed_results_{algorithm_name}_{experiment_id}.jsonl")
+    
+    with open(detailed_results_file, 'w', buffering=1 << 20) as detailed_file:
+        # The first line holds the fields shared by all trials, the records follow
+        header = {'experiment_id': experiment_id, 'n': n, 'algorithm': algorithm_name}
+        detailed_file.write(json.dumps({'header': header}, separators=(',', ':')) + '\n')
+        
+        outcomes = _map_trials(_run_trial, tasks, [algorithm], max_workers)
+        
+        # Per-trial output lines, written in batches
+        output_lines = []
+        
+        for k, ((dist_name, trial), outcome) in enumerate(zip(trials, outcomes)):
+            points, center, slope, counts, execution_time = outcome
             seed = base_seed + trial
-            points = generator.generate(n, seed=seed)
+            quadrant_counts = dict(zip(QUADRANT_LABELS, counts))
             
             # Store the first trial's points for visualization
             if trial == 0:
                 distribution_points[dist_name] = points
             
-            # Measure execution time
-            start_time = time.time()
-            center, slope = algorithm(points)
-            execution_time = time.time() - start_time
-            
-            # Count points in quadrants
-            quadrant_counts = count_points_in_quadrants(points, center, slope)
-            
             # Check if equipartition is valid
-            is_valid = is_equipartition_valid(quadrant_counts, n)
+            is_valid = is_equipartition_valid(counts, n)
             
             # Record result
             result = {
-                'experiment_id': experiment_id,
                 'distribution': dist_name,
                 'trial': trial + 1,
                 'counts': quadrant_counts,
@@ -104,15 +270,20 @@ def run_experiment(generator_names: List[str],
                 'time': execution_time,
                 'center': center,
                 'slope': slope,
-                'n': n,
-                'seed': seed,
-                'algorithm': algorithm_name
+                'seed': seed
             }
-            all_results.append(result)
+            detailed_file.write(json.dumps(result, separators=(',', ':')) + '\n')
+            
+            # Fixed-layout counts for analyze_results, kept out of the JSON record
+            result['counts_arr'] = np.array(counts, dtype=np.int32)
+            all_results[k] = result
             
             if verbose:
-                print(f"{dist_name:<20} {trial+1:<6} {quadrant_counts['Q1']:<5} {quadrant_counts['Q2']:<5} "
-                      f"{quadrant_counts['Q3']:<5} {quadrant_counts['Q4']:<5} {str(is_valid):<8} {execution_time:.6f}")
+                q1, q2, q3, q4 = counts
+                output_lines.append(f"{dist_name:<20} {trial+1:<6} {q1:<5} {q2:<5} {q3:<5} {q4:<5} "
+                                    f"{_VALID_LABELS[is_valid]} {execution_time:.6f}")
+                if len(output_lines) >= _OUTPUT_BATCH_SIZE:
+                    _flush_lines(output_lines)
             
             # Generate plot for first trial of each distribution
             if plot_examples and trial == 0:
@@ -121,6 +292,8 @@ def run_experiment(generator_names: List[str],
                 save_path = os.path.join(plots_dir, plot_filename)
                 plot_result(points, center, slope, title=plot_title, save_path=save_path, 
                            quadrant_counts=quadrant_counts)
+        
+        _flush_lines(output_lines)
     
     # Plot all distributions for comparison
     if plot_examples:
@@ -131,19 +304,6 @@ def run_experiment(generator_names: List[str],
     # Calculate summary statistics
     summary = analyze_results(all_results, n, verbose)
     
-    # Save the detailed results as JSON
-    detailed_results_file = os.path.join(results_dir, f"detailed_results_{algorithm_name}_{experiment_id}.json")
-    
-    # Convert to JSON-serializable format (tuples to lists)
-    json_results = []
-    for result in all_results:
-        json_result = result.copy()
-        json_result['center'] = list(json_result['center'])  # Convert tuple to list
-        json_results.append(json_result)
-    
-    with open(detailed_results_file, 'w') as f:
-        json.dump(json_results, f, indent=2)
-    
     # Save the summary as JSON
     summary_file = os.path.join(results_dir, f"summary_{algorithm_name}_{experiment_id}.json")
     with open(summary_file, 'w') as f:
@@ -177,8 +337,10 @@ def analyze_results(results, n, verbose=True):
     if verbose:
         print(f"\nExpected counts for valid equipartition: {expected_min} or {expected_max}")
     
-    # Group results by distribution
-    distributions = set(r['distribution'] for r in results)
+    # Group results by distribution in a single pass
+    results_by_distribution = defaultdict(list)
+    for r in results:
+        results_by_distribution[r['distribution']].append(r)
     
     # Analyze results by distribution
     if verbose:
@@ -195,30 +357,23 @@ def analyze_results(results, n, verbose=True):
         'timestamp': datetime.datetime.now().isoformat(),
     }
     
-    for dist_name in distributions:
-        dist_results = [r for r in results if r['distribution'] == dist_name]
+    for dist_name, dist_results in results_by_distribution.items():
         valid_count = sum(1 for r in dist_results if r['is_valid'])
         valid_percent = (valid_count / len(dist_results)) * 100
         
-        # Calculate average counts
-        avg_q1 = sum(r['counts']['Q1'] for r in dist_results) / len(dist_results)
-        avg_q2 = sum(r['counts']['Q2'] for r in dist_results) / len(dist_results)
-        avg_q3 = sum(r['counts']['Q3'] for r in dist_results) / len(dist_results)
-        avg_q4 = sum(r['counts']['Q4'] for r in dist_results) / len(dist_results)
+        # Quadrant counts as a (trials, 4) array and times as a 1-D array, so the
+        # statistics below are NumPy reductions instead of Python loops
+        counts = np.stack([r['counts_arr'] for r in dist_results])
+        times = np.array([r['time'] for r in dist_results], dtype=np.float64)
         
-        # Calculate standard deviations
-        std_q1 = math.sqrt(sum((r['counts']['Q1'] - avg_q1)**2 for r in dist_results) / len(dist_results))
-        std_q2 = math.sqrt(sum((r['counts']['Q2'] - avg_q2)**2 for r in dist_results) / len(dist_results))
-        std_q3 = math.sqrt(sum((r['counts']['Q3'] - avg_q3)**2 for r in dist_results) / len(dist_results))
-        std_q4 = math.sqrt(sum((r['counts']['Q4'] - avg_q4)**2 for r in dist_results) / len(dist_results))
+        # Calculate average counts and standard deviations, accumulating the int32
+        # counts in float64
+        avg_q1, avg_q2, avg_q3, avg_q4 = counts.mean(axis=0, dtype=np.float64).tolist()
+        std_q1, std_q2, std_q3, std_q4 = np.sqrt(np.var(counts, axis=0, dtype=np.float64)).tolist()
         
         # Calculate average imbalance (max difference from n/4)
         target = n / 4
-        avg_imbalance = sum(max(abs(r['counts']['Q1'] - target), 
-                                abs(r['counts']['Q2'] - target),
-                                abs(r['counts']['Q3'] - target), 
-                                abs(r['counts']['Q4'] - target)) 
-                             for r in dist_results) / len(dist_results)
+        avg_imbalance = float(np.abs(counts - target).max(axis=1).mean())
         
         if verbose:
             print(f"{dist_name:<20} {valid_count}/{len(dist_results):<12} {valid_percent:>6.1f}% {avg_q1:>8.1f} {avg_q2:>8.1f} {avg_q3:>8.1f} {avg_q4:>8.1f}")
@@ -242,11 +397,10 @@ def analyze_results(results, n, verbose=True):
             },
             'avg_imbalance': avg_imbalance,
             'performance': {
-                'avg_time': sum(r['time'] for r in dist_results) / len(dist_results),
-                'min_time': min(r['time'] for r in dist_results),
-                'max_time': max(r['time'] for r in dist_results),
-                'std_time': math.sqrt(sum((r['time'] - sum(r['time'] for r in dist_results) / len(dist_results))**2 
-                                         for r in dist_results) / len(dist_results))
+                'avg_time': float(times.mean()),
+                'min_time': float(times.min()),
+                'max_time': float(times.max()),
+                'std_time': float(times.std())
             }
         }
     
@@ -254,6 +408,7 @@ def analyze_results(results, n, verbose=True):
     total_valid = sum(1 for r in results if r['is_valid'])
     total_trials = len(results)
     overall_valid_percent = (total_valid / total_trials) * 100
+    all_times = np.array([r['time'] for r in results], dtype=np.float64)
     
     if verbose:
         print(f"\nOverall valid equipartitions: {total_valid}/{total_trials} ({overall_valid_percent:.1f}%)")
@@ -264,20 +419,68 @@ def analyze_results(results, n, verbose=True):
         'valid_count': total_valid,
         'total_trials': total_trials,
         'valid_percent': overall_valid_percent,
-        'avg_time': sum(r['time'] for r in results) / len(results),
-        'min_time': min(r['time'] for r in results),
-        'max_time': max(r['time'] for r in results)
+        'avg_time': float(all_times.mean()),
+        'min_time': float(all_times.min()),
+        'max_time': float(all_times.max())
     }
     
     return summary
 
 
+def _run_comparison(task: tuple):
+    """
+    Run both algorithms on every trial of one distribution and point count.
+    
+    Args:
+        task: Tuple (generator, n, seeds, point_dtype)
+        
+    Returns:
+        Tuple (original_times, original_valid_count, efficient_times, efficient_valid_count)
+    """
+    generator, n, seeds, point_dtype = task
+    
+    original_times = []
+    original_valid_count = 0
+    efficient_times = []
+    efficient_valid_count = 0
+    
+    # Time both algorithms back to back on each point set, while it is still in cache
+    for seed in seeds:
+        points, xs, ys = _generate_axes(generator, n, seed, point_dtype)
+        
+        start_time = time.perf_counter_ns()
+        original_center, original_slope = orthogonal_equipartition(points)
+        split_time = time.perf_counter_ns()
+        efficient_center, efficient_slope = orthogonal_equipartition_efficient(points)
+        end_time = time.perf_counter_ns()
+        
+        original_times.append((split_time - start_time) * 1e-9)
+        efficient_times.append((end_time - split_time) * 1e-9)
+        
+        # Check if each equipartition is valid (only the verdict is needed here, not
+        # the counts), checking only once when both algorithms found the same lines
+        original_valid = is_equipartition_valid_soa(xs, ys, original_center, original_slope, n)
+        if (efficient_center, efficient_slope) == (original_center, original_slope):
+            efficient_valid = original_valid
+        else:
+            efficient_valid = is_equipartition_valid_soa(xs, ys, efficient_center, efficient_slope, n)
+        
+        if original_valid:
+            original_valid_count += 1
+        if efficient_valid:
+            efficient_valid_count += 1
+    
+    return original_times, original_valid_count, efficient_times, efficient_valid_count
+
+
 def compare_algorithms(generator_names: List[str], 
                       num_points_list: List[int] = [100, 200, 500, 1000, 2000], 
                       num_trials: int = 5, 
                       base_seed: int = 42,
                       verbose: bool = True,
-                      results_dir: str = "results"):
+                      results_dir: str = "results",
+                      max_workers: Optional[int] = None,
+                      point_dtype: type = np.float64):
     """
     Compare the performance of the original and efficient algorithms.
     
@@ -288,21 +491,24 @@ def compare_algorithms(generator_names: List[str],
         base_seed: Base random seed for reproducibility
         verbose: Whether to print detailed output
         results_dir: Directory to save results
+        max_workers: Number of worker processes for the trials (default: run them in this process)
+        point_dtype: Float type the point coordinates are stored in (np.float64 or np.float32)
         
     Returns:
         Dictionary with comparison results
     """
     # Ensure results directory exists
-    os.makedirs(results_dir, exist_ok=True)
+    _ensure_dir(results_dir)
     
     # Create timestamp for this experiment run
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     comparison_id = f"comparison_{timestamp}"
     
     # Results tracking
     comparison_results = {
         'comparison_id': comparison_id,
-        'timestamp': datetime.datetime.now().isoformat(),
+        'timestamp': now.isoformat(),
         'num_trials': num_trials,
         'base_seed': base_seed,
         'generators': generator_names,
@@ -317,82 +523,50 @@ def compare_algorithms(generator_names: List[str],
         print(f"{'Points':<10} {'Distribution':<15} {'Algorithm':<10} {'Avg Time (s)':<15} {'Valid %':<10} {'Speedup':<10}")
         print("=" * 80)
     
-    # Run tests for each point count
-    for n in num_points_list:
-        comparison_results['results'][n] = {}
+    # Look up each generator once and create seeds for all trials
+    generators = {dist_name: get_generator(dist_name) for dist_name in generator_names}
+    seeds = [base_seed + i for i in range(num_trials)]
+    
+    # One task per point count and distribution
+    configurations = [(n, dist_name) for n in num_points_list for dist_name in generator_names]
+    tasks = [(generators[dist_name], n, seeds, point_dtype) for n, dist_name in configurations]
+    outcomes = _map_trials(_run_comparison, tasks,
+                           [orthogonal_equipartition, orthogonal_equipartition_efficient], max_workers)
+    
+    # Collect the results for each point count and distribution
+    for (n, dist_name), outcome in zip(configurations, outcomes):
+        original_times, original_valid_count, efficient_times, efficient_valid_count = outcome
+        comparison_results['results'].setdefault(n, {})
+        comparison_results['results'][n][dist_name] = {'original': {}, 'efficient': {}}
         
-        for dist_name in generator_names:
-            generator = get_generator(dist_name)
-            comparison_results['results'][n][dist_name] = {'original': {}, 'efficient': {}}
-            
-            # Create seeds for all trials
-            seeds = [base_seed + i for i in range(num_trials)]
-            
-            # Generate point sets for all trials
-            point_sets = [generator.generate(n, seed=seed) for seed in seeds]
-            
-            # Test original algorithm
-            original_times = []
-            original_valid_count = 0
-            
-            for points in point_sets:
-                # Measure execution time
-                start_time = time.time()
-                center, slope = orthogonal_equipartition(points)
-                execution_time = time.time() - start_time
-                original_times.append(execution_time)
-                
-                # Check if equipartition is valid
-                quadrant_counts = count_points_in_quadrants(points, center, slope)
-                is_valid = is_equipartition_valid(quadrant_counts, n)
-                if is_valid:
-                    original_valid_count += 1
-            
-            original_avg_time = sum(original_times) / len(original_times)
-            original_valid_percent = (original_valid_count / num_trials) * 100
-            
-            # Test efficient algorithm
-            efficient_times = []
-            efficient_valid_count = 0
-            
-            for points in point_sets:
-                # Measure execution time
-                start_time = time.time()
-                center, slope = orthogonal_equipartition_efficient(points)
-                execution_time = time.time() - start_time
-                efficient_times.append(execution_time)
-                
-                # Check if equipartition is valid
-                quadrant_counts = count_points_in_quadrants(points, center, slope)
-                is_valid = is_equipartition_valid(quadrant_counts, n)
-                if is_valid:
-                    efficient_valid_count += 1
-            
-            efficient_avg_time = sum(efficient_times) / len(efficient_times)
-            efficient_valid_percent = (efficient_valid_count / num_trials) * 100
-            
-            # Calculate speedup
-            speedup = original_avg_time / efficient_avg_time if efficient_avg_time > 0 else float('inf')
-            
-            # Store results
-            comparison_results['results'][n][dist_name]['original'] = {
-                'avg_time': original_avg_time,
-                'valid_percent': original_valid_percent,
-                'times': original_times,
-                'valid_count': original_valid_count
-            }
-            
-            comparison_results['results'][n][dist_name]['efficient'] = {
-                'avg_time': efficient_avg_time,
-                'valid_percent': efficient_valid_percent,
-                'times': efficient_times,
-                'valid_count': efficient_valid_count,
-                'speedup': speedup
-            }
-            
-            if verbose:
-                print(f"{n:<10} {dist_name:<15} {'Original':<10} {original_avg_time:<15.6f} {original_valid_percent:<10.1f} {'-':<10}")
-                print(f"{'':<10} {'':<15} {'Efficient':<10} {efficient_avg_time:<15.6f} {efficient_valid_percent:<10.1f} {speedup:<10.2f}x")
+        original_avg_time = sum(original_times) / len(original_times)
+        original_valid_percent = (original_valid_count / num_trials) * 100
+        
+        efficient_avg_time = sum(efficient_times) / len(efficient_times)
+        efficient_valid_percent = (efficient_valid_count / num_trials) * 100
+        
+        # Calculate speedup
+        speedup = original_avg_time / efficient_avg_time if efficient_avg_time > 0 else float('inf')
+        
+        # Store results
+        comparison_results['results'][n][dist_name]['original'] = {
+            'avg_time': original_avg_time,
+            'valid_percent': original_valid_percent,
+            'times': original_times,
+            'valid_count': original_valid_count
+        }
+        
+        comparison_results['results'][n][dist_name]['efficient'] = {
+            'avg_time': efficient_avg_time,
+            'valid_percent': efficient_valid_percent,
+            'times': efficient_times,
+            'valid_count': efficient_valid_count,
+            'speedup': speedup
+        }
+        
+        if verbose:
+            print(f"{n:<10} {dist_name:<15} {'Original':<10} {original_avg_time:<15.6f} {original_valid_percent:<10.1f} {'-':<10}")
+            print(f"{'':<10} {'':<15} {'Efficient':<10} {efficient_avg_time:<15.6f} {efficient_valid_percent:<10.1f} {speedup:<10.2f}x")
         
     # Save the comparison results as JSON
     comparison_file = os.path.join(results_dir, f"algorithm_comparison_{comparison_id}.json")
@@ -5,6 +5,8 @@ with various point distributions.
 import argparse
 import os
 
+import numpy as np
+
 from algorithm import (
     orthogonal_equipartition, 
     orthogonal_equipartition_efficient, 
@@ -57,6 +59,12 @@ def parse_args():
                         default=[100, 200, 500, 1000, 2000],
                         help='Point sizes to use for comparison (default: 100 200 500 1000 2000)')
     
+    parser.add_argument('--point-dtype', type=str, default='float64', choices=['float64', 'float32'],
+                        help='Float type of the point coordinates (default: float64)')
+    
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of worker processes for the trials (default: 1, run them serially)')
+    
     return parser.parse_args()
 
 
@@ -75,7 +83,9 @@ if __name__ == "__main__":
             num_trials=args.trials,
             base_seed=args.seed,
             verbose=not args.quiet,
-            results_dir=args.results_dir
+            results_dir=args.results_dir,
+            max_workers=args.workers,
+            point_dtype=np.dtype(args.point_dtype).type
         )
         
         print(f"\nAlgorithm comparison completed successfully!")
@@ -93,7 +103,9 @@ if __name__ == "__main__":
             verbose=not args.quiet,
             plots_dir=args.plots_dir,
             results_dir=args.results_dir,
-            use_efficient=args.efficient
+            use_efficient=args.efficient,
+            max_workers=args.workers,
+            point_dtype=np.dtype(args.point_dtype).type
         )
         
         print(f"\nExperiment {experiment_id} completed successfully!")
\ No newline at end of file
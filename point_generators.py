@@ -1,52 +1,164 @@
+import os
+import threading
+
 import numpy as np
 from sklearn.datasets import make_blobs, make_circles, make_moons
 from typing import List, Tuple, Optional, Union, Dict, Any
 
+from algorithm_numba import NUMBA_AVAILABLE
+from point_generators_numba import mark_repeats
+
+# Set POINT_GENERATORS_CHECK=1 to assert that points from generators which skip
+# ensure_general_position really are in general position
+_CHECK_GENERAL_POSITION = os.environ.get('POINT_GENERATORS_CHECK', '') not in ('', '0')
+
+# Per-thread unseeded generator used when ensure_general_position gets no rng
+_thread_state = threading.local()
+
+
+def _default_rng() -> np.random.Generator:
+    """
+    Get this thread's shared unseeded random generator, creating it on first use.
+    
+    Generator objects are not thread-safe, so each thread gets its own.
+    
+    Returns:
+        numpy Generator
+    """
+    rng = getattr(_thread_state, 'rng', None)
+    if rng is None:
+        rng = _thread_state.rng = np.random.default_rng()
+    
+    return rng
+
+
+def _repeated_values(values: np.ndarray) -> np.ndarray:
+    """
+    Mark every value that repeats an earlier one (all occurrences but the first).
+    
+    Args:
+        values: 1-D array of values
+        
+    Returns:
+        Boolean array of the same length
+    """
+    if NUMBA_AVAILABLE:
+        # One compiled scan over the stable sort order
+        return mark_repeats(values, np.argsort(values, kind='stable'))
+    
+    _, first_index = np.unique(values, return_index=True)
+    repeats = np.ones(len(values), dtype=bool)
+    repeats[first_index] = False
+    
+    return repeats
+
+
 class PointGenerator:
     """Base class for point generators that ensure general position."""
     
+    # Whether the distribution itself can repeat coordinates. Continuous distributions
+    # do so with probability zero in float64, so they skip the duplicate scan
+    _needs_general_position = False
+    
     @staticmethod
-    def ensure_general_position(points: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    def ensure_general_position(points: Union[np.ndarray, List[Tuple[float, float]]],
+                                rng: Optional[np.random.Generator] = None,
+                                dtype: type = np.float64) -> np.ndarray:
         """
         Ensure points are in general position (no two points share x or y coordinates).
         
         Args:
-            points: List of (x, y) coordinates
+            points: Array of shape (n, 2) or list of (x, y) coordinates
+            rng: Random generator for the perturbations (default: an unseeded one shared
+                by all calls on the same thread)
+            dtype: Float type of the returned coordinates. Duplicates are resolved at
+                this precision, so no two coordinates collide after rounding
             
         Returns:
-            Modified points in general position
+            Modified points in general position, as an array of shape (n, 2)
         """
-        # Add small perturbations to ensure general position
-        used_x = set()
-        used_y = set()
+        if rng is None:
+            rng = _default_rng()
         
-        result = []
-        for x, y in points:
-            # Perturb x if necessary
-            while x in used_x:
-                x += np.random.uniform(-0.01, 0.01)
+        pts = np.array(points, dtype=dtype).reshape(-1, 2)
+        
+        # Add small perturbations to ensure general position: on each axis, every
+        # repeat of an already used coordinate is perturbed, in bulk, until all
+        # coordinates are distinct
+        for axis in (0, 1):
+            scale = 1
+            previous_duplicates = None
             
-            # Perturb y if necessary
-            while y in used_y:
-                y += np.random.uniform(-0.01, 0.01)
+            while True:
+                duplicate = _repeated_values(pts[:, axis])
+                
+                num_duplicates = np.count_nonzero(duplicate)
+                if num_duplicates == 0:
+                    break
+                
+                # Widen the perturbations whenever a round fails to reduce the number
+                # of duplicates, e.g. when more points share a coordinate than there
+                # are representable values within 0.01 of it
+                if previous_duplicates is not None and num_duplicates >= previous_duplicates:
+                    scale *= 2
+                previous_duplicates = num_duplicates
+                
+                # Perturb by up to 0.01, but at least a few units in the last place, as
+                # smaller perturbations of large coordinates would round away
+                values = pts[duplicate, axis]
+                width = scale * np.maximum(0.01, 4 * np.abs(np.spacing(values)).astype(np.float64))
+                pts[duplicate, axis] = values + rng.uniform(-width, width).astype(dtype)
             
-            used_x.add(x)
-            used_y.add(y)
-            result.append((float(x), float(y)))
+        return pts
+    
+    def _in_general_position(self, points: np.ndarray, dtype: type,
+                             rng: Optional[np.random.Generator] = None,
+                             seed: Optional[int] = None, force: bool = False) -> np.ndarray:
+        """
+        Return the points in the requested precision, resolving duplicates only when needed.
+        
+        Args:
+            points: Array of shape (n, 2) with the (x, y) coordinates
+            dtype: Float type of the returned coordinates
+            rng: Random generator for the perturbations (default: one created from seed,
+                only if the duplicate scan runs)
+            seed: Seed for the perturbations when no rng is given
+            force: Whether these parameters can produce repeated coordinates
             
-        return result
+        Returns:
+            Points in general position, as an array of shape (n, 2)
+        """
+        # Rounding to float32 can make distinct coordinates collide
+        if self._needs_general_position or force or np.dtype(dtype) != np.float64:
+            if rng is None:
+                rng = np.random.default_rng(seed)
+            return self.ensure_general_position(points, rng, dtype)
+        
+        pts = np.asarray(points, dtype=dtype)
+        
+        if _CHECK_GENERAL_POSITION:
+            for axis in (0, 1):
+                assert np.unique(pts[:, axis]).size == len(pts), \
+                    f"{type(self).__name__} repeated a coordinate on axis {axis}"
+        
+        return pts
     
-    def generate(self, n: int, seed: Optional[int] = None, **kwargs) -> List[Tuple[float, float]]:
+    def generate(self, n: int, seed: Optional[int] = None, dtype: type = np.float64,
+                 **kwargs) -> np.ndarray:
         """
         Generate n points in general position.
         
+        Implementations draw from a local np.random.Generator (or pass the seed to
+        scikit-learn), so seeding never touches NumPy's global random state.
+        
         Args:
             n: Number of points to generate
             seed: Random seed for reproducibility
+            dtype: Float type of the coordinates (np.float64 or np.float32)
             **kwargs: Additional parameters specific to each generator
             
         Returns:
-            List of (x, y) coordinates
+            Array of shape (n, 2) with the (x, y) coordinates
         """
         raise NotImplementedError("Subclasses must implement this method")
 
@@ -54,139 +166,118 @@ class PointGenerator:
 class UniformGenerator(PointGenerator):
     """Generate points from a uniform distribution."""
     
-    def generate(self, n: int, seed: Optional[int] = None, 
-                low: float = 0, high: float = 100) -> List[Tuple[float, float]]:
+    def generate(self, n: int, seed: Optional[int] = None, dtype: type = np.float64,
+                low: float = 0, high: float = 100) -> np.ndarray:
         """
         Generate n points from a uniform distribution in general position.
         
         Args:
             n: Number of points to generate
             seed: Random seed for reproducibility
+            dtype: Float type of the coordinates (np.float64 or np.float32)
             low: Lower bound for coordinates
             high: Upper bound for coordinates
             
         Returns:
-            List of (x, y) coordinates
+            Array of shape (n, 2) with the (x, y) coordinates
         """
-        if seed is not None:
-            np.random.seed(seed)
-            
-        # Generate points from uniform distribution
-        points = []
-        while len(points) < n:
-            batch_size = min(n * 2, n * 10)  # Generate extra points in case of duplicates
-            x_coords = np.random.uniform(low, high, batch_size)
-            y_coords = np.random.uniform(low, high, batch_size)
-            
-            for x, y in zip(x_coords, y_coords):
-                points.append((float(x), float(y)))
-                if len(points) >= n:
-                    break
+        rng = np.random.default_rng(seed)
+        
+        # Generate points from uniform distribution in a single draw
+        points = rng.uniform(low, high, (n, 2))
         
         # Ensure general position
-        return self.ensure_general_position(points[:n])
+        return self._in_general_position(points, dtype, rng=rng)
 
 
 class GaussianGenerator(PointGenerator):
     """Generate points from a Gaussian (normal) distribution."""
     
-    def generate(self, n: int, seed: Optional[int] = None,
+    def generate(self, n: int, seed: Optional[int] = None, dtype: type = np.float64,
                 mean: Tuple[float, float] = (50, 50), 
-                std: float = 20) -> List[Tuple[float, float]]:
+                std: float = 20) -> np.ndarray:
         """
         Generate n points from a Gaussian distribution in general position.
         
         Args:
             n: Number of points to generate
             seed: Random seed for reproducibility
+            dtype: Float type of the coordinates (np.float64 or np.float32)
             mean: Mean (center) of the Gaussian distribution
             std: Standard deviation
             
         Returns:
-            List of (x, y) coordinates
+            Array of shape (n, 2) with the (x, y) coordinates
         """
-        if seed is not None:
-            np.random.seed(seed)
-        
         # Use scikit-learn's make_blobs with a single cluster
         X, _ = make_blobs(
-            n_samples=n * 2,  # Generate extra points in case of duplicates
+            n_samples=n,
             n_features=2,
             centers=[mean],
             cluster_std=std,
             random_state=seed
         )
         
-        # Convert to list of tuples
-        points = [(float(x), float(y)) for x, y in X]
-        
         # Ensure general position
-        return self.ensure_general_position(points[:n])
+        return self._in_general_position(X, dtype, seed=seed)
 
 
 class BimodalGenerator(PointGenerator):
     """Generate points from a bimodal distribution (two Gaussian clusters)."""
     
-    def generate(self, n: int, seed: Optional[int] = None,
+    def generate(self, n: int, seed: Optional[int] = None, dtype: type = np.float64,
                 means: List[Tuple[float, float]] = [(25, 25), (75, 75)],
-                std: float = 15) -> List[Tuple[float, float]]:
+                std: float = 15) -> np.ndarray:
         """
         Generate n points from a bimodal distribution in general position.
         
         Args:
             n: Number of points to generate
             seed: Random seed for reproducibility
+            dtype: Float type of the coordinates (np.float64 or np.float32)
             means: Centers of the Gaussian clusters
             std: Standard deviation for clusters
             
         Returns:
-            List of (x, y) coordinates
+            Array of shape (n, 2) with the (x, y) coordinates
         """
-        if seed is not None:
-            np.random.seed(seed)
-        
         # Use scikit-learn's make_blobs with multiple clusters
         X, _ = make_blobs(
-            n_samples=n * 2,  # Generate extra points in case of duplicates
+            n_samples=n,
             n_features=2,
             centers=means,
             cluster_std=std,
             random_state=seed
         )
         
-        # Convert to list of tuples
-        points = [(float(x), float(y)) for x, y in X]
-        
         # Ensure general position
-        return self.ensure_general_position(points[:n])
+        return self._in_general_position(X, dtype, seed=seed)
 
 
 class CircularGenerator(PointGenerator):
     """Generate points in a circular pattern."""
     
-    def generate(self, n: int, seed: Optional[int] = None,
+    def generate(self, n: int, seed: Optional[int] = None, dtype: type = np.float64,
                 center: Tuple[float, float] = (50, 50),
                 radius: float = 40,
-                noise: float = 0.1) -> List[Tuple[float, float]]:
+                noise: float = 0.1) -> np.ndarray:
         """
         Generate n points in a circular pattern in general position.
         
         Args:
             n: Number of points to generate
             seed: Random seed for reproducibility
+            dtype: Float type of the coordinates (np.float64 or np.float32)
             center: Center of the circle
             radius: Radius of the circle
             noise: Amount of noise to add (0 to 1)
             
         Returns:
-            List of (x, y) coordinates
+            Array of shape (n, 2) with the (x, y) coordinates
         """
-        if seed is not None:
-            np.random.seed(seed)
-        
         # Use scikit-learn's make_circles
         X, _ = make_circles(
-            n_samples=n * 2,  # Generate extra points in case of duplicates
+            n_samples=n,
             noise=noise,
             random_state=seed
         )
@@ -194,39 +285,34 @@ class CircularGenerator(PointGenerator):
         # Scale to the desired radius and translate to center
         X = X * radius + np.array(center)
         
-        # Convert to list of tuples
-        points = [(float(x), float(y)) for x, y in X]
-        
-        # Ensure general position
-        return self.ensure_general_position(points[:n])
+        # Ensure general position (without noise the circles repeat coordinates)
+        return self._in_general_position(X, dtype, seed=seed, force=noise == 0)
 
 
 class MoonsGenerator(PointGenerator):
     """Generate points in a two crescent moon shapes."""
     
-    def generate(self, n: int, seed: Optional[int] = None,
+    def generate(self, n: int, seed: Optional[int] = None, dtype: type = np.float64,
                 center: Tuple[float, float] = (50, 50),
                 scale: float = 40,
-                noise: float = 0.1) -> List[Tuple[float, float]]:
+                noise: float = 0.1) -> np.ndarray:
         """
         Generate n points in a two crescent moon shapes in general position.
         
         Args:
             n: Number of points to generate
             seed: Random seed for reproducibility
+            dtype: Float type of the coordinates (np.float64 or np.float32)
             center: Center point to translate to
             scale: Scale factor for the moons
             noise: Amount of noise to add (0 to 1)
             
         Returns:
-            List of (x, y) coordinates
+            Array of shape (n, 2) with the (x, y) coordinates
         """
-        if seed is not None:
-            np.random.seed(seed)
-        
         # Use scikit-learn's make_moons
         X, _ = make_moons(
-            n_samples=n * 2,  # Generate extra points in case of duplicates
+            n_samples=n,
             noise=noise,
             random_state=seed
         )
@@ -234,52 +320,55 @@ class MoonsGenerator(PointGenerator):
         # Scale and translate
         X = X * scale + np.array(center) - np.array([scale/2, scale/2])
         
-        # Convert to list of tuples
-        points = [(float(x), float(y)) for x, y in X]
-        
-        # Ensure general position
-        return self.ensure_general_position(points[:n])
+        # Ensure general position (without noise the moons repeat coordinates)
+        return self._in_general_position(X, dtype, seed=seed, force=noise == 0)
 
 
 class GridGenerator(PointGenerator):
     """Generate points in a perturbed grid pattern."""
     
-    def generate(self, n: int, seed: Optional[int] = None,
-                perturbation: float = 0.2) -> List[Tuple[float, float]]:
+    # Grid coordinates repeat unless the perturbation separates them
+    _needs_general_position = True
+    
+    def generate(self, n: int, seed: Optional[int] = None, dtype: type = np.float64,
+                perturbation: float = 0.2) -> np.ndarray:
         """
         Generate n points in a perturbed grid pattern in general position.
         
         Args:
             n: Number of points to generate
             seed: Random seed for reproducibility
+            dtype: Float type of the coordinates (np.float64 or np.float32)
             perturbation: Amount of perturbation (0 to 1)
             
         Returns:
-            List of (x, y) coordinates
+            Array of shape (n, 2) with the (x, y) coordinates
         """
-        if seed is not None:
-            np.random.seed(seed)
+        rng = np.random.default_rng(seed)
         
         # Determine grid size
         grid_size = int(np.ceil(np.sqrt(n)))
         
-        # Generate grid points with perturbation
-        points = []
-        for i in range(grid_size):
-            for j in range(grid_size):
-                # Add small random perturbation to grid positions
-                x = i + np.random.uniform(-perturbation, perturbation)
-                y = j + np.random.uniform(-perturbation, perturbation)
-                points.append((float(x), float(y)))
-                
-                if len(points) >= n:
-                    break
-            
-            if len(points) >= n:
-                break
+        # Take the first n grid positions, row by row
+        grid_x, grid_y = np.mgrid[0:grid_size, 0:grid_size].reshape(2, -1)
+        points = np.stack([grid_x[:n], grid_y[:n]], axis=1).astype(np.float64)
+        
+        # Add small random perturbation to grid positions
+        points += rng.uniform(-perturbation, perturbation, points.shape)
         
         # Ensure general position
-        return self.ensure_general_position(points[:n])
+        return self._in_general_position(points, dtype, rng=rng)
+
+
+# Generators are stateless, so a single instance of each is shared
+_GENERATORS = {
+    'uniform': UniformGenerator(),
+    'gaussian': GaussianGenerator(),
+    'bimodal': BimodalGenerator(),
+    'circular': CircularGenerator(),
+    'moons': MoonsGenerator(),
+    'grid': GridGenerator()
+}
 
 
 # Factory function to get generator by name
@@ -293,16 +382,7 @@ def get_generator(name: str) -> PointGenerator:
     Returns:
         PointGenerator instance
     """
-    generators = {
-        'uniform': UniformGenerator(),
-        'gaussian': GaussianGenerator(),
-        'bimodal': BimodalGenerator(),
-        'circular': CircularGenerator(),
-        'moons': MoonsGenerator(),
-        'grid': GridGenerator()
-    }
-    
-    if name.lower() not in generators:
-        raise ValueError(f"Unknown generator: {name}. Available generators: {', '.join(generators.keys())}")
+    if name.lower() not in _GENERATORS:
+        raise ValueError(f"Unknown generator: {name}. Available generators: {', '.join(_GENERATORS.keys())}")
     
-    return generators[name.lower()]
\ No newline at end of file
+    return _GENERATORS[name.lower()]
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""
+Compiled kernels for the point generators.
+
+Uses the same optional-Numba setup as algorithm_numba: without Numba the kernels
+run as plain Python functions.
+"""
+import numpy as np
+
+from algorithm_numba import njit, prange
+
+# Number of sorted positions scanned by one parallel task in mark_repeats
+REPEAT_CHUNK_SIZE = 4096
+
+
+@njit(cache=True, parallel=True)
+def mark_repeats(values: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """
+    Mark every value that repeats an earlier one.
+
+    With a stable sort order, equal values are adjacent and appear in index order, so a
+    single scan marks all occurrences of a value except the first. Each position only
+    compares with its predecessor and marks a distinct index, so the sorted positions are
+    split into chunks that are scanned in parallel. The random perturbations are drawn
+    afterwards by the caller, so the results do not depend on the number of threads.
+
+    Args:
+        values: Values to check
+        order: Stable argsort of values
+
+    Returns:
+        Boolean array, True where values[i] equals a value at a smaller index
+    """
+    num_values = order.shape[0]
+    repeats = np.zeros(values.shape[0], dtype=np.bool_)
+    num_chunks = (num_values + REPEAT_CHUNK_SIZE - 1) // REPEAT_CHUNK_SIZE
+
+    for chunk in prange(num_chunks):
+        first = max(chunk * REPEAT_CHUNK_SIZE, 1)
+        last = min((chunk + 1) * REPEAT_CHUNK_SIZE, num_values)
+
+        for k in range(first, last):
+            if values[order[k]] == values[order[k - 1]]:
+                repeats[order[k]] = True
+
+    return repeats
@@ -1,9 +1,51 @@
 import matplotlib.pyplot as plt
 import numpy as np
-from typing import List, Tuple, Optional, Dict, Any
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from typing import Tuple, Optional, Dict, Any
+
+def _offscreen_subplots(rows: int, cols: int, figsize: Tuple[int, int],
+                        constrained_layout: bool = False):
+    """
+    Create a figure with a grid of axes for saving, without registering it with pyplot.
+    
+    The figure is not tracked by pyplot's figure manager, so it needs no GUI setup,
+    is never shown by a later plt.show(), and is freed once it goes out of scope.
+    
+    Args:
+        rows: Number of subplot rows
+        cols: Number of subplot columns
+        figsize: Figure size
+        constrained_layout: Whether the figure lays out its axes with constrained layout
+        
+    Returns:
+        Tuple (fig, axes) as returned by plt.subplots
+    """
+    fig = Figure(figsize=figsize, constrained_layout=constrained_layout)
+    FigureCanvasAgg(fig)
+    
+    return fig, fig.subplots(rows, cols)
+
+
+def _plot_line(ax, center: Tuple[float, float], slope: float, x_vals: np.ndarray, color: str):
+    """
+    Draw a line through the center, spanning the given x range unless it is nearly vertical.
+    
+    Args:
+        ax: Axes to draw on
+        center: Point (x, y) the line passes through
+        slope: Slope of the line
+        x_vals: Array [min_x, max_x] with the x range to span
+        color: Line color
+    """
+    if abs(slope) < 1000:  # Not nearly vertical
+        y_vals = center[1] + slope * (x_vals - center[0])
+        ax.plot(x_vals, y_vals, color=color, linestyle='-', label=f'Slope: {slope:.2f}')
+    else:  # Nearly vertical
+        ax.axvline(x=center[0], color=color, label='Vertical')
 
 
-def plot_result(points: List[Tuple[float, float]], 
+def plot_result(points: np.ndarray, 
                center: Tuple[float, float], 
                slope: float, 
                title: str = "Orthogonal Equipartition", 
@@ -15,7 +57,7 @@ def plot_result(points: List[Tuple[float, float]],
     Plot the points and the two perpendicular lines.
     
     Args:
-        points: List of (x, y) coordinates
+        points: Array of shape (n, 2) with the (x, y) coordinates
         center: Concurrency point (x, y)
         slope: Slope of the first line
         title: Plot title
@@ -24,11 +66,15 @@ def plot_result(points: List[Tuple[float, float]],
         show_counts: Whether to show quadrant counts on the plot
         figsize: Figure size
     """
-    fig, ax = plt.subplots(figsize=figsize)
+    if save_path:
+        fig, ax = _offscreen_subplots(1, 1, figsize)
+    else:
+        fig, ax = plt.subplots(figsize=figsize)
     
     # Plot points
-    xs, ys = zip(*points)
-    ax.scatter(xs, ys, c='blue', alpha=0.5)
+    xy = np.asarray(points)
+    xs, ys = xy[:, 0], xy[:, 1]
+    ax.plot(xs, ys, 'o', color='blue', markersize=3, alpha=0.5, rasterized=True)
     
     # Plot center point
     ax.scatter(center[0], center[1], c='red', s=100, zorder=5)
@@ -37,8 +83,7 @@ def plot_result(points: List[Tuple[float, float]],
     perp_slope = -1/slope if slope != 0 else float('inf')
     
     # Calculate line limits based on data range
-    min_x, max_x = min(xs), max(xs)
-    min_y, max_y = min(ys), max(ys)
+    (min_x, min_y), (max_x, max_y) = xy.min(axis=0), xy.max(axis=0)
     
     # Add some padding
     padding = 0.1 * max(max_x - min_x, max_y - min_y)
@@ -47,30 +92,14 @@ def plot_result(points: List[Tuple[float, float]],
     min_y -= padding
     max_y += padding
     
-    # Plot first line
-    if abs(slope) < 1000:  # Not nearly vertical
-        x_vals = np.array([min_x, max_x])
-        y_vals = center[1] + slope * (x_vals - center[0])
-        ax.plot(x_vals, y_vals, 'r-', label=f'Slope: {slope:.2f}')
-    else:  # Nearly vertical
-        y_vals = np.array([min_y, max_y])
-        ax.axvline(x=center[0], color='r', label='Vertical')
-    
-    # Plot perpendicular line
-    if abs(perp_slope) < 1000:  # Not nearly vertical
-        x_vals = np.array([min_x, max_x])
-        y_vals = center[1] + perp_slope * (x_vals - center[0])
-        ax.plot(x_vals, y_vals, 'g-', label=f'Slope: {perp_slope:.2f}')
-    else:  # Nearly vertical
-        ax.axvline(x=center[0], color='g', label='Vertical')
+    # Plot the first line and the perpendicular one
+    x_vals = np.array([min_x, max_x])
+    _plot_line(ax, center, slope, x_vals, color='r')
+    _plot_line(ax, center, perp_slope, x_vals, color='g')
     
     # Add quadrant labels with counts if available
     if show_counts and quadrant_counts:
-        # Calculate positions for quadrant labels
-        mid_x = (min_x + max_x) / 2
-        mid_y = (min_y + max_y) / 2
-        
-        # Adjust label positions to fit in each quadrant
+        # Place each label part of the way from the center towards its corner of the plot
         q1_pos = (center[0] + 0.3 * (max_x - center[0]), center[1] + 0.3 * (max_y - center[1]))
         q2_pos = (center[0] - 0.3 * (center[0] - min_x), center[1] + 0.3 * (max_y - center[1]))
         q3_pos = (center[0] - 0.3 * (center[0] - min_x), center[1] - 0.3 * (center[1] - min_y))
@@ -101,20 +130,19 @@ def plot_result(points: List[Tuple[float, float]],
     ax.set_aspect('equal')
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close(fig)
+        fig.savefig(save_path, dpi=150, bbox_inches='tight')
     else:
         plt.show()
         
         
-def plot_multiple_distributions(distributions_points: Dict[str, List[Tuple[float, float]]], 
+def plot_multiple_distributions(distributions_points: Dict[str, np.ndarray], 
                               figsize: Tuple[int, int] = (15, 10),
                               save_path: Optional[str] = None):
     """
     Plot multiple point distributions for comparison.
     
     Args:
-        distributions_points: Dictionary mapping distribution names to point lists
+        distributions_points: Dictionary mapping distribution names to (n, 2) point arrays
         figsize: Figure size
         save_path: If provided, save the plot to this path instead of displaying
     """
@@ -124,7 +152,10 @@ def plot_multiple_distributions(distributions_points: Dict[str, List[Tuple[float
     cols = min(3, n_distributions)
     rows = (n_distributions + cols - 1) // cols
     
-    fig, axes = plt.subplots(rows, cols, figsize=figsize)
+    if save_path:
+        fig, axes = _offscreen_subplots(rows, cols, figsize, constrained_layout=True)
+    else:
+        fig, axes = plt.subplots(rows, cols, figsize=figsize, constrained_layout=True)
     if rows == 1 and cols == 1:
         axes = np.array([axes])
     axes = axes.flatten()
@@ -132,9 +163,10 @@ def plot_multiple_distributions(distributions_points: Dict[str, List[Tuple[float
     for i, (dist_name, points) in enumerate(distributions_points.items()):
         if i < len(axes):
             ax = axes[i]
-            xs, ys = zip(*points)
-            ax.scatter(xs, ys, alpha=0.5)
-            ax.set_title(f"{dist_name} (n={len(points)})")
+            pts = np.asarray(points)
+            ax.plot(pts[:, 0], pts[:, 1], 'o', color='C0', markersize=3, alpha=0.5,
+                    rasterized=True)
+            ax.set_title(f"{dist_name} (n={pts.shape[0]})")
             ax.set_xlabel('X')
             ax.set_ylabel('Y')
             ax.grid(True)
@@ -144,10 +176,7 @@ def plot_multiple_distributions(distributions_points: Dict[str, List[Tuple[float
     for i in range(n_distributions, len(axes)):
         axes[i].axis('off')
     
-    plt.tight_layout()
-    
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close(fig)
+        fig.savefig(save_path, dpi=300, bbox_inches='tight')
     else:
         plt.show()
\ No newline at end of file